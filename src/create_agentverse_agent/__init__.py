@@ -2,13 +2,14 @@
 
 from importlib.metadata import version
 
-from .cli import app
+__version__ = version("create-agentverse-agent")
 
 
 def main() -> None:
     """Main entry point for CLI."""
+    from .cli import app
+
     app()
 
 
 __all__ = ["main"]
-__version__ = version("create-agentverse-agent")
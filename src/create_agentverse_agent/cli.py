@@ -1,17 +1,15 @@
 import logging
-from importlib.metadata import version
+from pathlib import Path
 from typing import Annotated
 from uuid import uuid4
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.text import Text
 
-from .prompts import UserAbortError
+from . import __version__ as _APP_VERSION
 
 logger = logging.getLogger("create-agentverse-agent")
+logger.addHandler(logging.NullHandler())
 
 app = typer.Typer(
     help="✨ Create an AgentVerse agent with style.",
@@ -30,9 +28,8 @@ class CLIStopExecution(typer.Exit):
 def version_callback(show_version: bool) -> None:
     """Show version and exit."""
     if show_version:
-        app_version = version("create-agentverse-agent")
         console.print(
-            f"[bold cyan]create-agentverse-agent[/bold cyan] version [green]{app_version}[/green]"
+            f"[bold cyan]create-agentverse-agent[/bold cyan] version [green]{_APP_VERSION}[/green]"
         )
         raise CLIStopExecution()
 
@@ -95,9 +92,17 @@ def main(
       [dim]# Advanced configuration[/dim]
       create-agentverse-agent -a
     """
+    # Heavy imports are deferred so the --version path stays lightweight
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.text import Text
+
+    from .prompts import UserAbortError
+
     # Set logging level based on verbose flag
 
-    execution_id = f"create-agentverse-agent-{version('create-agentverse-agent')}-cli-execution-{uuid4()}"
+    execution_id = f"create-agentverse-agent-{_APP_VERSION}-cli-execution-{uuid4()}"
 
     if debug:
         logging.basicConfig(
@@ -107,12 +112,14 @@ def main(
         )
         logger.debug("Verbose logging enabled")
     else:
-        logging.basicConfig(
-            level=logging.CRITICAL,
-        )
+        # Silence all loggers without building a stream handler + formatter
+        logging.getLogger().setLevel(logging.CRITICAL)
 
     logger.debug(
-        f"CLI options: default={default}, advanced={advanced}, overwrite={overwrite}"
+        "CLI options: default=%s, advanced=%s, overwrite=%s",
+        default,
+        advanced,
+        overwrite,
     )
 
     try:
@@ -120,30 +127,40 @@ def main(
 
         logger.info("Starting configuration collection")
         config = collect_configuration(default=default, advanced=advanced)
-        logger.debug(f"Configuration collected: display_name={config.display_name}")
+        logger.debug("Configuration collected: display_name=%s", config.display_name)
 
         from .scaffold import Scaffolder
         from .templates import TemplateRenderer
 
-        # Show progress with spinner
-        console.print()
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task(f"Creating agent '{config.display_name}'...", total=None)
-
+        def build_project() -> Path:
             logger.debug("Initializing template renderer")
             renderer = TemplateRenderer()
 
             logger.debug("Initializing scaffolder")
             scaffolder = Scaffolder(renderer)
 
-            logger.info(f"Creating project with overwrite={overwrite}")
-            project_path = scaffolder.create_project(config, overwrite=overwrite)
-            logger.debug(f"Project created at: {project_path.absolute()}")
+            logger.info("Creating project with overwrite=%s", overwrite)
+            return scaffolder.create_project(config, overwrite=overwrite)
+
+        if console.is_terminal:
+            # Show progress with spinner
+            console.print()
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[bold cyan]{task.description}"),
+                console=console,
+                transient=True,
+            ) as progress:
+                progress.add_task(
+                    f"Creating agent '{config.display_name}'...", total=None
+                )
+                project_path = build_project()
+        else:
+            # Piped or redirected output: the spinner would be invisible noise
+            project_path = build_project()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Project created at: %s", project_path.absolute())
 
         # Success message with clear next steps
         success_text = Text()
@@ -185,45 +202,37 @@ def main(
             padding=(1, 2),
         )
 
-        console.print(success_panel)
-        console.print()
+        # One print renders the whole block: each console.print call pays a
+        # full markup parse, segment render, and flush
+        console.print(Group(success_panel, ""))
 
         logger.info("Agent created successfully")
 
     except UserAbortError:
         logger.warning("Setup cancelled by user")
-        console.print()
-        console.print()
-        console.print("[yellow]   ✖  Setup cancelled by user[/yellow]")
-        console.print()
+        console.print("\n\n[yellow]   ✖  Setup cancelled by user[/yellow]\n")
         UserAbortError()
 
     except FileExistsError as e:
-        logger.error(f"Project already exists: {e}")
-        console.print()
-        console.print("[bold red]   ✖  Error: Project already exists[/bold red]")
-        console.print(f"[dim red]   {e}[/dim red]")
-        console.print()
+        logger.error("Project already exists: %s", e)
         console.print(
-            "[dim yellow]   💡 Use --overwrite flag to replace the existing project[/dim yellow]"
+            "\n[bold red]   ✖  Error: Project already exists[/bold red]\n"
+            f"[dim red]   {e}[/dim red]\n\n"
+            "[dim yellow]   💡 Use --overwrite flag to replace the existing project[/dim yellow]\n"
         )
-        console.print()
         typer.Abort()
 
     except KeyboardInterrupt:
         logger.warning("Setup interrupted by keyboard")
-        console.print()
-        console.print()
-        console.print("[yellow]   ✖  Setup cancelled by user[/yellow]")
-        console.print()
+        console.print("\n\n[yellow]   ✖  Setup cancelled by user[/yellow]\n")
         UserAbortError()
 
     except Exception as e:
-        logger.exception(f"Failed to create agent: {e}")
-        console.print()
-        console.print("[bold red]   ✖  Failed to create agent[/bold red]")
-        console.print(f"[dim red]   {e}[/dim red]")
-        console.print()
+        logger.exception("Failed to create agent: %s", e)
+        console.print(
+            "\n[bold red]   ✖  Failed to create agent[/bold red]\n"
+            f"[dim red]   {e}[/dim red]\n"
+        )
         typer.Abort()
 
     finally:
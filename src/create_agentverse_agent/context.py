@@ -1,12 +1,55 @@
 # src/create_agentverse_agent/context.py
 import logging
+import re
+import string
+from functools import cached_property
 from pathlib import Path
+from secrets import token_hex
 from typing import Any, override
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator
 
 logger = logging.getLogger(__name__)
 
+# Compiled once per process instead of per model construction.
+_NAME_RE = re.compile(r"^[a-zA-Z0-9\s]+$")
+_SEED_RE = re.compile(r"^[a-zA-Z0-9]+$")
+
+# JWT segments are checked with delete-tables: translating away every
+# permitted character must leave nothing behind.
+_JWT_SEGMENT_CHARS = string.ascii_letters + string.digits + "-_"
+_JWT_SEGMENT_TABLE = str.maketrans("", "", _JWT_SEGMENT_CHARS)
+_JWT_SIGNATURE_TABLE = str.maketrans("", "", _JWT_SEGMENT_CHARS + "=")
+
+# Translation table for slugifying display names in a single pass.
+_SAFE_NAME_TABLE = str.maketrans({" ": "-", "_": "-"})
+
+# Computed properties cached on the instance; dropped when a field changes.
+_CACHED_PROPERTIES = (
+    "display_name",
+    "safe_name",
+    "project_path",
+    "agent_route",
+    "hosting_endpoint",
+)
+
+
+def _looks_like_jwt(value: str) -> bool:
+    """Check the header.payload.signature shape in a few linear passes."""
+    parts = value.split(".")
+    if len(parts) != 3:
+        return False
+    header, payload, signature = parts
+    return (
+        len(header) > 3
+        and header.startswith("eyJ")
+        and not header.translate(_JWT_SEGMENT_TABLE)
+        and len(payload) > 3
+        and payload.startswith("eyJ")
+        and not payload.translate(_JWT_SEGMENT_TABLE)
+        and not signature.translate(_JWT_SIGNATURE_TABLE)
+    )
+
 
 class AgentContextError(Exception):
     """Custom exception for port conflicts."""
@@ -21,7 +64,6 @@ class AgentContext(BaseModel):
         default=None,
         min_length=1,
         max_length=100,
-        pattern=r"^[a-zA-Z0-9\s]+$",
         title="Agent Name",
         description="The human-readable name of the agent",
         examples=["My Agent", "Test Agent 123"],
@@ -35,10 +77,9 @@ class AgentContext(BaseModel):
     """
 
     agent_seed_phrase: str = Field(
-        default_factory=lambda: __import__("secrets").token_hex(32),
+        default_factory=lambda: token_hex(32),
         min_length=1,
         max_length=500,
-        pattern=r"^[a-zA-Z0-9]+$",
         title="Agent Seed Phrase",
         description="A random seed string (alphanumeric, typically 32+ chars)",
         examples=["aB3kL9mN2pQ5rT8vX1yZ4"],
@@ -128,7 +169,6 @@ class AgentContext(BaseModel):
         default=None,
         min_length=20,
         max_length=1000,
-        pattern=r"^eyJ[A-Za-z0-9\-_]+\.eyJ[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_=]*$",
         title="AgentVerse API Key",
         description="API key for AgentVerse services (JWT format)",
         examples=["eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."],
@@ -210,17 +250,44 @@ class AgentContext(BaseModel):
     Time window in minutes for rate limiting.
     """
 
+    @field_validator("agent_name")
+    @classmethod
+    def check_agent_name_pattern(cls, value: str | None) -> str | None:
+        """Ensure the agent name contains only letters, numbers, and spaces."""
+        if value is not None and not _NAME_RE.fullmatch(value):
+            raise ValueError("must contain only letters, numbers, and spaces")
+        return value
+
+    @field_validator("agent_seed_phrase")
+    @classmethod
+    def check_seed_phrase_pattern(cls, value: str) -> str:
+        """Ensure the seed phrase is strictly alphanumeric."""
+        if not _SEED_RE.fullmatch(value):
+            raise ValueError("must contain only letters and numbers")
+        return value
+
+    @field_validator("agentverse_api_key")
+    @classmethod
+    def check_api_key_pattern(cls, value: str | None) -> str | None:
+        """Ensure the API key looks like a JWT (header.payload.signature)."""
+        if value is not None and not _looks_like_jwt(value):
+            raise ValueError("must be a JWT of the form 'eyJ...'.'eyJ...'.'...'")
+        return value
+
     def model_post_init(self, __context: Any) -> None:
         """Log context initialization after model is created."""
-        logger.info(
-            "AgentContext initialized: name=%s, env=%s", self.display_name, self.env
-        )
-        logger.debug(
-            "Agent configuration: port=%d, hosting=%s:%d",
-            self.agent_port,
-            self.hosting_address,
-            self.hosting_port,
-        )
+        # Gated so display_name is not computed just to be thrown away.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "AgentContext initialized: name=%s, env=%s", self.display_name, self.env
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Agent configuration: port=%d, hosting=%s:%d",
+                self.agent_port,
+                self.hosting_address,
+                self.hosting_port,
+            )
         if self.is_api_keys_provided():
             logger.debug("API keys configured: agentverse=yes")
         else:
@@ -229,21 +296,14 @@ class AgentContext(BaseModel):
                 "yes" if self.agentverse_api_key else "no",
             )
 
-    @model_validator(mode="after")
-    def check_ports_different(self) -> "AgentContext":
-        """Ensure agent_port and hosting_port are different."""
-        if self.agent_port == self.hosting_port:
-            logger.error(
-                "Port conflict: agent_port=%d and hosting_port=%d are the same",
-                self.agent_port,
-                self.hosting_port,
-            )
-            raise AgentContextError(
-                f"Agent port ({self.agent_port}) and hosting port ({self.hosting_port}) must be different."
-            )
-        return self
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign the field, then drop any stale cached property values."""
+        super().__setattr__(name, value)
+        for cached in _CACHED_PROPERTIES:
+            self.__dict__.pop(cached, None)
 
-    @property
+    @cached_property
     def display_name(self) -> str:
         """Formatted display name for the agent."""
         return (
@@ -252,22 +312,22 @@ class AgentContext(BaseModel):
             else "Agent " + self.agent_seed_phrase[:8]
         )
 
-    @property
+    @cached_property
     def safe_name(self) -> str:
         """URL-safe version of the agent name."""
-        return self.display_name.lower().replace(" ", "-").replace("_", "-")
+        return self.display_name.lower().translate(_SAFE_NAME_TABLE)
 
-    @property
+    @cached_property
     def project_path(self) -> Path:
         """The filesystem path where the agent project will be created."""
         return Path.cwd() / self.safe_name
 
-    @property
+    @cached_property
     def agent_route(self) -> str:
         """The URL route for accessing the agent."""
         return f"/{self.safe_name}"
 
-    @property
+    @cached_property
     def hosting_endpoint(self) -> str:
         """The full URL endpoint for the hosting service."""
         return f"http://{self.hosting_address}:{self.hosting_port}"
@@ -275,7 +335,8 @@ class AgentContext(BaseModel):
     @override
     def model_dump(self, **kwargs: Any) -> dict[str, Any]:
         """Custom model dump to include computed properties."""
-        logger.debug("Dumping model for agent: %s", self.display_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dumping model for agent: %s", self.display_name)
         data = super().model_dump(**kwargs)
         data.update(
             {
@@ -296,12 +357,29 @@ class AgentContext(BaseModel):
     def __repr__(self) -> str:
         """Custom repr to avoid exposing sensitive fields."""
         fields = ", ".join(
-            f"{k}={v!r}"
-            for k, v in self.model_dump().items()
-            if k not in {"agent_seed_phrase", "agentverse_api_key"}
+            f"{name}={getattr(self, name)!r}"
+            for name in type(self).model_fields
+            if name not in {"agent_seed_phrase", "agentverse_api_key"}
         )
         return f"{self.__class__.__name__}({fields})"
 
     def __str__(self) -> str:
         """String representation of the context."""
         return self.__repr__()
+
+
+def ensure_distinct_ports(context: AgentContext) -> None:
+    """Ensure agent_port and hosting_port are different.
+
+    The wizard mutates ports after construction, so this is checked once
+    on the finished configuration instead of in a model validator.
+    """
+    if context.agent_port == context.hosting_port:
+        logger.error(
+            "Port conflict: agent_port=%d and hosting_port=%d are the same",
+            context.agent_port,
+            context.hosting_port,
+        )
+        raise AgentContextError(
+            f"Agent port ({context.agent_port}) and hosting port ({context.hosting_port}) must be different."
+        )
@@ -2,11 +2,9 @@ import logging
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
-from rich.text import Text
 
-from .context import AgentContext
+from .context import AgentContext, ensure_distinct_ports
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +13,7 @@ console = Console()
 
 def header(text: str, emoji: str = "✨") -> None:
     """Display a stylish section header."""
-    logger.debug(f"Displaying header: {text}")
+    logger.debug("Displaying header: %s", text)
     console.print()
     console.print(f"[bold cyan]{emoji}  {text}[/bold cyan]")
     console.print(f"[dim blue]   {'─' * (len(text) + 2)}[/dim blue]")
@@ -23,13 +21,12 @@ def header(text: str, emoji: str = "✨") -> None:
 
 def success(text: str) -> None:
     """Display a success message."""
-    logger.info(text)
     console.print(f"[dim green]   ✓ {text}[/dim green]")
 
 
 def hint(text: str) -> None:
     """Display a helpful hint."""
-    logger.debug(f"Hint: {text}")
+    logger.debug("Hint: %s", text)
     console.print(f"[dim yellow]   💡 {text}[/dim yellow]")
 
 
@@ -37,9 +34,14 @@ def prompt_with_style(
     prompt_text: str,
     default: str | None = None,
     password: bool = False,
+    trailing_blank: bool = True,
 ) -> str:
-    """Styled prompt wrapper."""
-    logger.debug(f"Prompting user: {prompt_text}")
+    """Styled prompt wrapper.
+
+    Prints the spacer line after the prompt itself so callers do not need
+    a separate console.print() round-trip per field.
+    """
+    logger.debug("Prompting user: %s", prompt_text)
     formatted_prompt = f"   [bold white]{prompt_text}[/bold white]"
 
     if default is not None:
@@ -57,32 +59,41 @@ def prompt_with_style(
         )
         result = result if result else ""
 
-    if not password:
-        logger.debug(f"User input for '{prompt_text}': {result}")
-    else:
-        logger.debug(f"User input for '{prompt_text}': [REDACTED]")
+    if logger.isEnabledFor(logging.DEBUG):
+        if not password:
+            logger.debug("User input for '%s': %s", prompt_text, result)
+        else:
+            logger.debug("User input for '%s': [REDACTED]", prompt_text)
+    if trailing_blank:
+        console.print()
     return result
 
 
 def prompt_int(prompt_text: str, default: int) -> int:
     """Prompt for integer input."""
-    logger.debug(f"Prompting for integer: {prompt_text} (default: {default})")
+    logger.debug("Prompting for integer: %s (default: %d)", prompt_text, default)
+    default_str = str(default)
     while True:
-        response = prompt_with_style(prompt_text, default=str(default))
-        try:
+        response = prompt_with_style(
+            prompt_text, default=default_str, trailing_blank=False
+        ).strip()
+        # Cheap pre-check instead of exception-driven retry on typos
+        if response.removeprefix("-").isdecimal():
             value = int(response)
-            logger.debug(f"Integer input accepted: {value}")
+            logger.debug("Integer input accepted: %d", value)
+            console.print()
             return value
-        except ValueError:
-            logger.warning(f"Invalid integer input: {response}")
-            console.print("[red]   Please enter a valid number[/red]")
+        logger.warning("Invalid integer input: %s", response)
+        console.print("[red]   Please enter a valid number[/red]")
 
 
 def prompt_choice(prompt_text: str, choices: list[str], default: str) -> str:
     """Prompt for choice input."""
-    logger.debug(f"Prompting for choice: {prompt_text} (choices: {choices})")
+    logger.debug("Prompting for choice: %s (choices: %s)", prompt_text, choices)
     formatted_choices = " / ".join(f"[cyan]{c}[/cyan]" for c in choices)
     full_prompt = f"   [bold white]{prompt_text}[/bold white] ({formatted_choices})"
+    lowered_choices = frozenset(c.lower() for c in choices)
+    retry_message = f"[red]   Please choose one of: {', '.join(choices)}[/red]"
 
     while True:
         response = Prompt.ask(
@@ -90,16 +101,17 @@ def prompt_choice(prompt_text: str, choices: list[str], default: str) -> str:
             default=default,
             console=console,
         ).lower()
-        if response in [c.lower() for c in choices]:
-            logger.debug(f"Choice selected: {response}")
+        if response in lowered_choices:
+            logger.debug("Choice selected: %s", response)
+            console.print()
             return response
-        logger.warning(f"Invalid choice: {response}")
-        console.print(f"[red]   Please choose one of: {', '.join(choices)}[/red]")
+        logger.warning("Invalid choice: %s", response)
+        console.print(retry_message)
 
 
 def collect_agent_info(config: AgentContext, skip: bool = False) -> None:
     """Collect basic agent information."""
-    logger.info("Collecting agent information" + (" (skipped)" if skip else ""))
+    logger.info("Collecting agent information%s", " (skipped)" if skip else "")
     if skip:
         success("Using default agent configuration")
         return
@@ -110,8 +122,7 @@ def collect_agent_info(config: AgentContext, skip: bool = False) -> None:
         "What should we call your agent?",
         default=config.display_name,
     )
-    console.print()
-    logger.info(f"Agent name set to: {config.agent_name}")
+    logger.info("Agent name set to: %s", config.agent_name)
 
     hint("Your seed phrase is like a password - keep it safe!")
     config.agent_seed_phrase = prompt_with_style(
@@ -119,27 +130,24 @@ def collect_agent_info(config: AgentContext, skip: bool = False) -> None:
         default=config.agent_seed_phrase,
         password=True,
     )
-    console.print()
     logger.info("Agent seed phrase configured")
 
     config.agent_port = prompt_int(
         "Which port should your agent run on?",
         default=config.agent_port,
     )
-    console.print()
-    logger.info(f"Agent port set to: {config.agent_port}")
+    logger.info("Agent port set to: %d", config.agent_port)
 
     config.agent_description = prompt_with_style(
         "Describe your agent in a few words",
         default=config.agent_description,
     )
-    console.print()
-    logger.info(f"Agent description set to: {config.agent_description}")
+    logger.info("Agent description set to: %s", config.agent_description)
 
 
 def collect_hosting_info(config: AgentContext, skip: bool = False) -> None:
     """Collect hosting information."""
-    logger.info("Collecting hosting information" + (" (skipped)" if skip else ""))
+    logger.info("Collecting hosting information%s", " (skipped)" if skip else "")
     if skip:
         success("Using default hosting configuration")
         return
@@ -150,20 +158,18 @@ def collect_hosting_info(config: AgentContext, skip: bool = False) -> None:
         "Hosting address",
         default=config.hosting_address,
     )
-    console.print()
-    logger.info(f"Hosting address set to: {config.hosting_address}")
+    logger.info("Hosting address set to: %s", config.hosting_address)
 
     config.hosting_port = prompt_int(
         "Hosting port",
         default=config.hosting_port,
     )
-    console.print()
-    logger.info(f"Hosting port set to: {config.hosting_port}")
+    logger.info("Hosting port set to: %d", config.hosting_port)
 
 
 def collect_advanced_info(config: AgentContext, skip: bool = False) -> None:
     """Collect advanced performance and rate limiting settings."""
-    logger.info("Collecting advanced settings" + (" (skipped)" if skip else ""))
+    logger.info("Collecting advanced settings%s", " (skipped)" if skip else "")
     if skip:
         success("Using default advanced settings")
         return
@@ -176,22 +182,21 @@ def collect_advanced_info(config: AgentContext, skip: bool = False) -> None:
         "Maximum processed messages to track",
         default=config.max_processed_messages,
     )
-    console.print()
-    logger.info(f"Max processed messages set to: {config.max_processed_messages}")
+    logger.info("Max processed messages set to: %d", config.max_processed_messages)
 
     config.processed_message_ttl_minutes = prompt_int(
         "Processed message TTL (minutes)",
         default=config.processed_message_ttl_minutes,
     )
-    console.print()
-    logger.info(f"Processed message TTL set to: {config.processed_message_ttl_minutes}")
+    logger.info(
+        "Processed message TTL set to: %d", config.processed_message_ttl_minutes
+    )
 
     config.cleanup_interval_seconds = prompt_int(
         "Cleanup interval (seconds, min 10)",
         default=config.cleanup_interval_seconds,
     )
-    console.print()
-    logger.info(f"Cleanup interval set to: {config.cleanup_interval_seconds}")
+    logger.info("Cleanup interval set to: %d", config.cleanup_interval_seconds)
 
     console.print()
     hint("Rate limiting protects your agent from excessive requests")
@@ -200,20 +205,18 @@ def collect_advanced_info(config: AgentContext, skip: bool = False) -> None:
         "Max requests per window",
         default=config.rate_limit_max_requests,
     )
-    console.print()
-    logger.info(f"Rate limit max requests set to: {config.rate_limit_max_requests}")
+    logger.info("Rate limit max requests set to: %d", config.rate_limit_max_requests)
 
     config.rate_limit_window_minutes = prompt_int(
         "Rate limit window (minutes)",
         default=config.rate_limit_window_minutes,
     )
-    console.print()
-    logger.info(f"Rate limit window set to: {config.rate_limit_window_minutes}")
+    logger.info("Rate limit window set to: %d", config.rate_limit_window_minutes)
 
 
 def collect_environment_and_keys(config: AgentContext, skip: bool = False) -> None:
     """Collect environment and API keys."""
-    logger.info("Collecting environment and API keys" + (" (skipped)" if skip else ""))
+    logger.info("Collecting environment and API keys%s", " (skipped)" if skip else "")
     if skip:
         success("Skipping API keys (you can add them later)")
         return
@@ -225,8 +228,7 @@ def collect_environment_and_keys(config: AgentContext, skip: bool = False) -> No
         choices=["development", "production"],
         default=config.env,
     )
-    console.print()
-    logger.info(f"Environment set to: {config.env}")
+    logger.info("Environment set to: %s", config.env)
 
     console.print()
     hint("API keys are optional - you can add them to .env later")
@@ -238,7 +240,6 @@ def collect_environment_and_keys(config: AgentContext, skip: bool = False) -> No
             "AgentVerse API Key",
             password=True,
         )
-        console.print()
         logger.info("AgentVerse API key configured")
     else:
         logger.debug("AgentVerse API key skipped")
@@ -247,73 +248,79 @@ def collect_environment_and_keys(config: AgentContext, skip: bool = False) -> No
 def display_summary(config: AgentContext) -> None:
     """Display configuration summary using Rich table."""
     logger.debug("Displaying configuration summary")
-    console.print()
 
-    # Create summary panel
-    summary_text = Text()
-
-    # Agent Info
-    summary_text.append("🤖 Agent\n", style="bold cyan")
-    summary_text.append("   Name        : ", style="dim")
-    summary_text.append(f"{config.display_name}\n", style="bold white")
-    summary_text.append("   Port        : ", style="dim")
-    summary_text.append(f"{config.agent_port}\n", style="white")
-    summary_text.append("   Seed Phrase : ", style="dim")
-    summary_text.append(f"{config.agent_seed_phrase[:8]}{'•' * 10}\n", style="yellow")
-    summary_text.append("   Description : ", style="dim")
-    summary_text.append(f"{config.agent_description}\n\n", style="white")
-
-    # Hosting
-    summary_text.append("🌐 Hosting\n", style="bold cyan")
-    summary_text.append("   Address : ", style="dim")
-    summary_text.append(f"{config.hosting_address}\n", style="white")
-    summary_text.append("   Port    : ", style="dim")
-    summary_text.append(f"{config.hosting_port}\n\n", style="white")
-
-    # Environment
-    summary_text.append("⚙️  Environment\n", style="bold cyan")
-    summary_text.append("   Mode : ", style="dim")
-    env_style = "bold green" if config.env == "development" else "bold red"
-    summary_text.append(f"{config.env}\n", style=env_style)
+    if not console.is_terminal:
+        # Redirected output gets a compact plain summary instead of a
+        # panel full of ANSI sequences
+        console.print(
+            f"agent={config.display_name} port={config.agent_port} "
+            f"host={config.hosting_address}:{config.hosting_port} env={config.env}"
+        )
+        logger.info(
+            "Configuration summary: agent=%s, port=%d, env=%s",
+            config.display_name,
+            config.agent_port,
+            config.env,
+        )
+        return
+
+    # Panel/Text machinery is only needed here, so keep module import light
+    from rich.console import Group
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.text import Text
 
-    summary_text.append("   AgentVerse API Key : ", style="dim")
+    env_style = "bold green" if config.env == "development" else "bold red"
     if config.agentverse_api_key:
-        summary_text.append(f"{config.agentverse_api_key[:8]}•••\n\n", style="white")
+        api_key_markup = f"[white]{config.agentverse_api_key[:8]}•••[/white]"
     else:
-        summary_text.append("Not set\n\n", style="dim yellow")
-
-    # Advanced Settings
-    summary_text.append("🔧 Advanced Settings\n", style="bold cyan")
-    summary_text.append("   Max Processed Messages : ", style="dim")
-    summary_text.append(f"{config.max_processed_messages}\n", style="white")
-    summary_text.append("   Message TTL            : ", style="dim")
-    summary_text.append(f"{config.processed_message_ttl_minutes} min\n", style="white")
-    summary_text.append("   Cleanup Interval       : ", style="dim")
-    summary_text.append(f"{config.cleanup_interval_seconds} sec\n", style="white")
-    summary_text.append("   Rate Limit             : ", style="dim")
-    summary_text.append(
-        f"{config.rate_limit_max_requests} req / {config.rate_limit_window_minutes} min",
-        style="white",
+        api_key_markup = "[dim yellow]Not set[/dim yellow]"
+
+    # One markup parse instead of ~20 Text.append calls; user-supplied
+    # values are escaped so they cannot break the markup
+    summary_markup = (
+        "[bold cyan]🤖 Agent[/bold cyan]\n"
+        f"[dim]   Name        : [/dim][bold white]{escape(config.display_name)}[/bold white]\n"
+        f"[dim]   Port        : [/dim][white]{config.agent_port}[/white]\n"
+        f"[dim]   Seed Phrase : [/dim][yellow]{config.agent_seed_phrase[:8]}{'•' * 10}[/yellow]\n"
+        f"[dim]   Description : [/dim][white]{escape(config.agent_description)}[/white]\n\n"
+        "[bold cyan]🌐 Hosting[/bold cyan]\n"
+        f"[dim]   Address : [/dim][white]{escape(config.hosting_address)}[/white]\n"
+        f"[dim]   Port    : [/dim][white]{config.hosting_port}[/white]\n\n"
+        "[bold cyan]⚙️  Environment[/bold cyan]\n"
+        f"[dim]   Mode : [/dim][{env_style}]{escape(config.env)}[/{env_style}]\n"
+        f"[dim]   AgentVerse API Key : [/dim]{api_key_markup}\n\n"
+        "[bold cyan]🔧 Advanced Settings[/bold cyan]\n"
+        f"[dim]   Max Processed Messages : [/dim][white]{config.max_processed_messages}[/white]\n"
+        f"[dim]   Message TTL            : [/dim][white]{config.processed_message_ttl_minutes} min[/white]\n"
+        f"[dim]   Cleanup Interval       : [/dim][white]{config.cleanup_interval_seconds} sec[/white]\n"
+        f"[dim]   Rate Limit             : [/dim][white]{config.rate_limit_max_requests} req / {config.rate_limit_window_minutes} min[/white]"
     )
 
     panel = Panel(
-        summary_text,
+        Text.from_markup(summary_markup),
         title="[bold white]📋 Your Configuration[/bold white]",
         border_style="blue",
         padding=(1, 2),
     )
 
-    console.print(panel)
-    console.print()
+    # One print flushes the whole block including the surrounding blank lines
+    console.print(Group("", panel, ""))
 
     logger.info(
-        f"Configuration summary: agent={config.display_name}, "
-        f"port={config.agent_port}, env={config.env}"
+        "Configuration summary: agent=%s, port=%d, env=%s",
+        config.display_name,
+        config.agent_port,
+        config.env,
     )
 
 
 def divider() -> None:
     """Print a divider line."""
+    if not console.is_terminal:
+        # No markup parse or width-sized rule when output is redirected
+        console.print()
+        return
     console.print()
     console.print("[dim blue]" + "─" * console.width + "[/dim blue]")
     console.print()
@@ -330,13 +337,14 @@ def collect_configuration(default: bool, advanced: bool) -> AgentContext:
     Interactive configuration wizard with delightful UX.
     """
     logger.info(
-        f"Starting configuration wizard (default={default}, advanced={advanced})"
+        "Starting configuration wizard (default=%s, advanced=%s)", default, advanced
     )
     config = AgentContext()
 
     if default:
         logger.info("Using quick start mode with default configuration")
-        console.clear()
+        if console.is_terminal:
+            console.clear()
         console.print()
         console.print("[bold green]   ⚡ Quick Start Mode[/bold green]")
         success("Using default configuration for rapid setup")
@@ -344,7 +352,10 @@ def collect_configuration(default: bool, advanced: bool) -> AgentContext:
         return config
 
     # Welcome screen
-    console.clear()
+    from rich.panel import Panel
+
+    if console.is_terminal:
+        console.clear()
     console.print()
 
     welcome_panel = Panel(
@@ -368,7 +379,7 @@ def collect_configuration(default: bool, advanced: bool) -> AgentContext:
             default=False,
             console=console,
         )
-        logger.debug(f"Configure hosting: {configure_hosting}")
+        logger.debug("Configure hosting: %s", configure_hosting)
         collect_hosting_info(config, skip=not configure_hosting)
 
         divider()
@@ -377,7 +388,7 @@ def collect_configuration(default: bool, advanced: bool) -> AgentContext:
             default=True,
             console=console,
         )
-        logger.debug(f"Configure environment: {configure_env}")
+        logger.debug("Configure environment: %s", configure_env)
         collect_environment_and_keys(config, skip=not configure_env)
 
         divider()
@@ -386,7 +397,7 @@ def collect_configuration(default: bool, advanced: bool) -> AgentContext:
             default=False,
             console=console,
         )
-        logger.debug(f"Configure advanced settings: {configure_advanced}")
+        logger.debug("Configure advanced settings: %s", configure_advanced)
         collect_advanced_info(config, skip=not configure_advanced)
     else:
         logger.debug("Standard mode - skipping advanced options")
@@ -407,6 +418,8 @@ def collect_configuration(default: bool, advanced: bool) -> AgentContext:
         console.print("[red]   ✖ Setup cancelled[/red]")
         raise UserAbortError()
 
+    ensure_distinct_ports(config)
+
     console.print()
     success("Configuration complete! Creating your agent...")
     logger.info("Configuration wizard completed successfully")
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .context import AgentContext
@@ -19,43 +20,73 @@ class Scaffolder:
     def __init__(self, renderer: BaseTemplateRenderer) -> None:
         self.renderer = renderer
 
-    def create_project(self, context: AgentContext, overwrite: bool = False) -> Path:
+    def create_project(
+        self,
+        context: AgentContext,
+        overwrite: bool = False,
+        base_path: Path | None = None,
+    ) -> Path:
         """Create project directory and write all files.
 
         Args:
             context: Validated agent configuration
             overwrite: Allow overwriting existing directory
+            base_path: Directory to create the project in; defaults to the
+                current working directory (via context.project_path)
         """
-        project_path = context.project_path
+        if base_path is None:
+            project_path = context.project_path
+        else:
+            project_path = base_path / context.safe_name
         logger.info("Creating project at %s", project_path)
 
-        # Safety check
-        if project_path.exists() and not overwrite:
-            logger.error("Directory already exists: %s", project_path)
-            raise ScaffoldError(
-                f"Directory '{project_path}' already exists. "
-                "Use --overwrite to replace it."
-            )
-
-        if project_path.exists() and overwrite:
+        # Create the directory up front; catching FileExistsError replaces
+        # the separate exists() checks, so the common case is one mkdir call
+        try:
+            project_path.mkdir(parents=True)
+        except FileExistsError as err:
+            if not overwrite:
+                logger.error("Directory already exists: %s", project_path)
+                raise ScaffoldError(
+                    f"Directory '{project_path}' already exists. "
+                    "Use --overwrite to replace it."
+                ) from err
             logger.warning("Overwriting existing directory: %s", project_path)
-
-        # Create directory
-        project_path.mkdir(parents=True, exist_ok=overwrite)
         logger.debug("Created directory: %s", project_path)
 
-        # Write each file
-        context_dict = context.model_dump()
-        rendered_files = 0
-        for template_name in self.renderer.list_templates():
-            logger.debug("Processing template: %s", template_name)
-            output_name = template_name.replace("template.", "").replace(".j2", "")
-            logger.debug("Rendering template: %s -> %s", template_name, output_name)
-            content = self.renderer.render(template_name, context_dict)
+        # Write each file. A plain __dict__ copy skips pydantic's per-field
+        # serializer walk; the computed values templates rely on are added
+        # explicitly (overwriting any stale cached_property entries).
+        context_dict: dict[str, object] = dict(context.__dict__)
+        context_dict.update(
+            display_name=context.display_name,
+            safe_name=context.safe_name,
+            project_path=str(project_path),
+            agent_route=context.agent_route,
+            hosting_endpoint=context.hosting_endpoint,
+        )
+        template_names = self.renderer.list_templates()
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        def write_one(template_name: str) -> None:
+            # Anchored prefix/suffix strip: one check+slice each, and safe if
+            # "template." or ".j2" ever appears mid-name
+            output_name = template_name.removeprefix("template.").removesuffix(".j2")
+            if debug_enabled:
+                logger.debug("Rendering template: %s -> %s", template_name, output_name)
             output_path = project_path / output_name
-            output_path.write_text(content)
-            logger.debug("Wrote file: %s", output_path)
-            rendered_files += 1
+            self.renderer.render_to(template_name, context_dict, output_path)
+            if debug_enabled:
+                logger.debug("Wrote file: %s", output_path)
+
+        # write_text releases the GIL, so rendering one template overlaps
+        # with the disk write of another.
+        if template_names:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(template_names))
+            ) as executor:
+                list(executor.map(write_one, template_names))
 
-        logger.info("Successfully created project with %d files", rendered_files)
+        logger.info("Successfully created project with %d files", len(template_names))
         return project_path
@@ -1,8 +1,15 @@
 # src/create_agentverse_agent/templates.py
 import logging
+import os
 from importlib.resources import files
+from pathlib import Path
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    select_autoescape,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +26,21 @@ class BaseTemplateRenderer:
     def render(self, template_name: str, context: dict[str, object]) -> str:
         raise NotImplementedError
 
+    def render_to(
+        self, template_name: str, context: dict[str, object], path: Path
+    ) -> None:
+        """Render a template and write the output to ``path``.
+
+        The default materializes the full string via ``render`` and writes
+        it in one syscall; renderers that can stream should override this.
+        """
+        content = self.render(template_name, context)
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+
     def list_templates(self) -> list[str]:
         raise NotImplementedError
 
@@ -37,7 +59,18 @@ class TemplateRenderer(BaseTemplateRenderer):
             autoescape=select_autoescape(),
             trim_blocks=True,
             lstrip_blocks=True,
+            cache_size=-1,
+            auto_reload=False,
+            # Persist compiled bytecode in a per-user temp dir so repeat
+            # CLI runs skip the lex/parse/codegen step for every template.
+            bytecode_cache=FileSystemBytecodeCache(),
         )
+        # Compile every template once up front so render() is a dict lookup
+        # instead of a loader round-trip per call.
+        self._templates = {
+            name: self.env.get_template(name) for name in self.env.list_templates()
+        }
+        self._names = list(self._templates)
         logger.info("TemplateRenderer initialized successfully")
 
     def render(self, template_name: str, context: dict[str, object]) -> str:
@@ -56,7 +89,7 @@ class TemplateRenderer(BaseTemplateRenderer):
             list(context.keys()),
         )
         try:
-            template = self.env.get_template(template_name)
+            template = self._templates[template_name]
             result: str = template.render(**context)
             logger.debug("Successfully rendered template: %s", template_name)
             return result
@@ -64,8 +97,23 @@ class TemplateRenderer(BaseTemplateRenderer):
             logger.exception("Failed to render template: %s", template_name)
             raise TemplateError(f"Error rendering template '{template_name}'") from err
 
+    def render_to(
+        self, template_name: str, context: dict[str, object], path: Path
+    ) -> None:
+        """Stream a template straight to disk.
+
+        ``template.stream`` emits output in chunks, so the full rendered
+        string is never held in memory alongside its encoded bytes.
+        """
+        logger.debug("Streaming template: %s -> %s", template_name, path)
+        try:
+            template = self._templates[template_name]
+            template.stream(**context).dump(str(path), encoding="utf-8")
+        except Exception as err:
+            logger.exception("Failed to render template: %s", template_name)
+            raise TemplateError(f"Error rendering template '{template_name}'") from err
+
     def list_templates(self) -> list[str]:
         """List all available templates."""
-        templates: list[str] = self.env.list_templates()
-        logger.debug("Found %d templates: %s", len(templates), templates)
-        return templates
+        logger.debug("Found %d templates: %s", len(self._names), self._names)
+        return self._names
@@ -0,0 +1,222 @@
+"""Shared fixtures for the create_agentverse_agent test suite."""
+
+import itertools
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from create_agentverse_agent import cli, prompts
+from create_agentverse_agent.context import AgentContext
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+@dataclass
+class CliTestEnv:
+    """Captured state from a patched CLI invocation."""
+
+    tmp_path: Path
+    wizard_args: list[tuple[bool, bool]] = field(default_factory=list)
+    configs_seen: list[AgentContext] = field(default_factory=list)
+    overwrite_calls: list[bool] = field(default_factory=list)
+    config: AgentContext | None = None
+    wizard_error: BaseException | None = None
+    create_project_error: BaseException | None = None
+
+    def set_config(self, config: AgentContext) -> None:
+        """Use a specific configuration for the next invocation."""
+        self.config = config
+
+
+class DummyRenderer:
+    """Stand-in for TemplateRenderer; the CLI only constructs it."""
+
+
+class DummyScaffolder:
+    """Stand-in for Scaffolder routing calls into the active CliTestEnv.
+
+    Defined once at module scope instead of per test; the patched_cli
+    fixture points the class-level env at the current test's state.
+    """
+
+    env: CliTestEnv | None = None
+
+    def __init__(self, renderer: Any) -> None:
+        pass
+
+    def create_project(self, ctx: AgentContext, overwrite: bool = False) -> Path:
+        env = type(self).env
+        assert env is not None, "DummyScaffolder used outside patched_cli"
+        if env.create_project_error is not None:
+            raise env.create_project_error
+        env.configs_seen.append(ctx)
+        env.overwrite_calls.append(overwrite)
+        return env.tmp_path / ctx.safe_name
+
+
+@pytest.fixture(autouse=True)
+def _fast_token(
+    monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> None:
+    """Replace token_hex with a deterministic counter.
+
+    Every default AgentContext construction otherwise reads /dev/urandom
+    for a seed phrase. Tests that assert on real randomness opt out with
+    @pytest.mark.real_token.
+    """
+    if "real_token" in request.keywords:
+        return
+    counter = itertools.count()
+    monkeypatch.setattr(
+        "create_agentverse_agent.context.token_hex",
+        lambda nbytes=32: f"{next(counter):0{2 * nbytes}x}",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _stub_version(
+    monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> None:
+    """Pin cli._APP_VERSION so tests never depend on installed metadata.
+
+    Tests that assert on a specific version parametrize this fixture
+    indirectly; everything else gets the default.
+    """
+    monkeypatch.setattr(cli, "_APP_VERSION", getattr(request, "param", "1.0.0"))
+
+
+@pytest.fixture(scope="session")
+def default_ctx() -> AgentContext:
+    """One default AgentContext shared by every read-only default check.
+
+    Session scope is safe here because the consuming tests only read
+    attributes; anything that mutates a context builds its own.
+    """
+    return AgentContext()
+
+
+@pytest.fixture(scope="session")
+def named_ctx() -> AgentContext:
+    """A shared context with an explicit agent_name, read-only like above."""
+    return AgentContext(agent_name="Test Agent")
+
+
+@pytest.fixture
+def ctx(default_ctx: AgentContext) -> AgentContext:
+    """A mutable per-test copy of the shared default context.
+
+    model_copy duplicates the instance without re-running field
+    validation, so tests that mutate a default context skip the
+    construction cost entirely.
+    """
+    return default_ctx.model_copy(deep=True)
+
+
+@pytest.fixture
+def captured_prints(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    """Capture everything printed on the prompts console.
+
+    Replaces the per-test printed-list + closure + setattr boilerplate;
+    tests just assert on the returned buffer.
+    """
+    buf: list[Any] = []
+
+    def capture(text: Any = "", **_: Any) -> None:
+        buf.append(text)
+
+    monkeypatch.setattr(prompts.console, "print", capture)
+    return buf
+
+
+@pytest.fixture
+def stub_collectors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """No-op every collect_configuration collaborator in one go.
+
+    Wizard tests re-patch only the pieces they actually observe instead
+    of re-declaring the full set of stubs each time.
+    """
+    for name in (
+        "collect_agent_info",
+        "collect_hosting_info",
+        "collect_environment_and_keys",
+        "collect_advanced_info",
+        "display_summary",
+        "success",
+        "divider",
+    ):
+        monkeypatch.setattr(prompts, name, lambda *a, **k: None)
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Single CliRunner shared across tests; it is stateless between invokes."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def help_output(runner: CliRunner) -> str:
+    """ANSI-stripped --help output, rendered once per session.
+
+    Help output is deterministic and side-effect-free, so tests probing
+    it share a single Typer invocation.
+    """
+    result = runner.invoke(cli.app, ["--help"])
+    assert result.exit_code == 0
+    return _ANSI_RE.sub("", result.stdout)
+
+
+@pytest.fixture
+def make_config() -> Callable[..., AgentContext]:
+    """Factory for AgentContext instances with sensible test defaults."""
+
+    def make(**overrides: Any) -> AgentContext:
+        fields: dict[str, Any] = {
+            "agent_name": "T",
+            "agent_seed_phrase": "seed12345678",
+            "agent_port": 1234,
+            "hosting_address": "localhost",
+            "hosting_port": 8080,
+        }
+        fields.update(overrides)
+        return AgentContext(**fields)
+
+    return make
+
+
+@pytest.fixture
+def patched_cli(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    make_config: Callable[..., AgentContext],
+) -> CliTestEnv:
+    """Patch the CLI collaborators and record what the command passes them.
+
+    The wizard, renderer and scaffolder are replaced with stubs that write
+    their arguments into the returned CliTestEnv. Tests can inject a
+    specific config via set_config() or make either stage raise by setting
+    wizard_error / create_project_error.
+    """
+    env = CliTestEnv(tmp_path=tmp_path)
+
+    def mock_collect_configuration(default: bool, advanced: bool) -> AgentContext:
+        env.wizard_args.append((default, advanced))
+        if env.wizard_error is not None:
+            raise env.wizard_error
+        if env.config is None:
+            env.config = make_config()
+        return env.config
+
+    monkeypatch.setattr(DummyScaffolder, "env", env)
+    monkeypatch.setattr(prompts, "collect_configuration", mock_collect_configuration)
+    # String-form targets keep templates/scaffold (and jinja2) out of
+    # collection-time imports; they load on the first test that needs them
+    monkeypatch.setattr(
+        "create_agentverse_agent.templates.TemplateRenderer", DummyRenderer
+    )
+    monkeypatch.setattr("create_agentverse_agent.scaffold.Scaffolder", DummyScaffolder)
+    return env
@@ -1,7 +1,8 @@
 """Tests for the __init__ module and package initialization."""
 
 import importlib
-from unittest.mock import MagicMock
+import runpy
+from unittest.mock import Mock
 
 import pytest
 
@@ -79,10 +80,8 @@ class TestMainFunction:
 
         monkeypatch.setattr("create_agentverse_agent.cli.app", mock_app)
 
-        # Re-import to get the updated main that uses the mocked app
-        import create_agentverse_agent
-
-        importlib.reload(create_agentverse_agent)
+        # main() imports app at call time, so the patch is picked up
+        # without reloading the package
         create_agentverse_agent.main()
 
         assert app_called == [True]
@@ -106,16 +105,21 @@ class TestDunderMain:
 
         assert __main__ is not None
 
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
     def test_dunder_main_calls_main(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test that running __main__ calls the main function."""
-        mock_main = MagicMock()
+        """Test that running __main__ calls the main function.
+
+        runpy warns that __main__ is already in sys.modules (an earlier
+        test imports it); that is expected here, not a problem.
+        """
+        mock_main = Mock()
         monkeypatch.setattr("create_agentverse_agent.main", mock_main)
 
-        # Simulate running as __main__
-        import create_agentverse_agent.__main__ as main_module
+        # runpy executes __main__.py with __name__ == "__main__" without
+        # re-importing the (already loaded) package
+        runpy.run_module("create_agentverse_agent", run_name="__main__")
 
-        importlib.reload(main_module)
-        # Note: The actual call happens at import time when __name__ == "__main__"
+        mock_main.assert_called_once()
 
 
 class TestPackageMetadata:
@@ -136,35 +140,22 @@ class TestPackageMetadata:
         assert pkg_metadata["Name"] == "create-agentverse-agent"
 
 
-class TestSubmoduleAccess:
-    """Test access to submodules from main package."""
-
-    def test_cli_module_accessible(self) -> None:
-        """Test that cli module is accessible."""
-        from create_agentverse_agent import cli
-
-        assert hasattr(cli, "app")
+# Each submodule with the attribute it must expose.
+_SUBMODULE_EXPORTS = (
+    ("cli", "app"),
+    ("context", "AgentContext"),
+    ("prompts", "collect_configuration"),
+    ("scaffold", "Scaffolder"),
+    ("templates", "TemplateRenderer"),
+)
 
-    def test_context_module_accessible(self) -> None:
-        """Test that context module is accessible."""
-        from create_agentverse_agent import context
 
-        assert hasattr(context, "AgentContext")
-
-    def test_prompts_module_accessible(self) -> None:
-        """Test that prompts module is accessible."""
-        from create_agentverse_agent import prompts
-
-        assert hasattr(prompts, "collect_configuration")
-
-    def test_scaffold_module_accessible(self) -> None:
-        """Test that scaffold module is accessible."""
-        from create_agentverse_agent import scaffold
-
-        assert hasattr(scaffold, "Scaffolder")
+class TestSubmoduleAccess:
+    """Test access to submodules from main package."""
 
-    def test_templates_module_accessible(self) -> None:
-        """Test that templates module is accessible."""
-        from create_agentverse_agent import templates
+    @pytest.mark.parametrize(("name", "attr"), _SUBMODULE_EXPORTS)
+    def test_submodule_exposes_attr(self, name: str, attr: str) -> None:
+        """Test that each submodule is importable and exposes its API."""
+        module = importlib.import_module(f"create_agentverse_agent.{name}")
 
-        assert hasattr(templates, "TemplateRenderer")
+        assert hasattr(module, attr)
@@ -1,6 +1,8 @@
 """Comprehensive tests for the scaffold module."""
 
 import logging
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -14,7 +16,9 @@ class DummyRenderer(BaseTemplateRenderer):
     """Dummy renderer for testing."""
 
     def __init__(self, templates: list[str] | None = None) -> None:
-        self.render_calls: list[tuple[str, dict[str, object]]] = []
+        # deque appends are C-level and thread-safe, which matters since
+        # the scaffolder renders from a thread pool
+        self.render_calls: deque[tuple[str, dict[str, object]]] = deque()
         if templates is None:
             self._templates = [
                 "template.agent.py.j2",
@@ -23,10 +27,13 @@ class DummyRenderer(BaseTemplateRenderer):
             ]
         else:
             self._templates = templates
+        # The output depends only on the (fixed) template name, so format
+        # it once here instead of on every render call
+        self._rendered = {t: f"rendered {t}" for t in self._templates}
 
     def render(self, template_name: str, context: dict[str, object]) -> str:
         self.render_calls.append((template_name, context))
-        return f"rendered {template_name}"
+        return self._rendered[template_name]
 
     def list_templates(self) -> list[str]:
         return self._templates
@@ -42,74 +49,65 @@ class FailingRenderer(BaseTemplateRenderer):
         return ["template.fail.j2"]
 
 
+@pytest.fixture
+def renderer() -> DummyRenderer:
+    """A DummyRenderer with the default template set."""
+    return DummyRenderer()
+
+
+@pytest.fixture
+def scaffolder(renderer: DummyRenderer) -> Scaffolder:
+    """A Scaffolder wired to the shared DummyRenderer."""
+    return Scaffolder(renderer)
+
+
 class TestScaffolder:
     """Test Scaffolder class."""
 
-    def test_init_stores_renderer(self) -> None:
+    def test_init_stores_renderer(
+        self, renderer: DummyRenderer, scaffolder: Scaffolder
+    ) -> None:
         """Test that scaffolder stores the renderer."""
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
         assert scaffolder.renderer is renderer
 
     def test_create_project_returns_path(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that create_project returns the project path."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Test Agent",
-            agent_seed_phrase="seedphrase123",
-            agent_port=9000,
-            hosting_address="example.com",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name="Test Agent")
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         assert project_path == tmp_path / "test-agent"
 
     def test_create_project_creates_directory(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that create_project creates the project directory."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
+        context = make_config(agent_name="Directory Test")
 
-        context = AgentContext(
-            agent_name="Directory Test",
-            agent_seed_phrase="dirseed12345",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
-
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         assert project_path.exists()
         assert project_path.is_dir()
 
     def test_create_project_writes_expected_files(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        renderer: DummyRenderer,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that create_project writes all expected files."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Test Agent",
-            agent_seed_phrase="seedphrase123",
-            agent_port=9000,
-            hosting_address="example.com",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name="Test Agent")
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         assert project_path == tmp_path / "test-agent"
         for template_name in renderer.list_templates():
@@ -119,75 +117,57 @@ class TestScaffolder:
             assert file_path.read_text() == f"rendered {template_name}"
 
     def test_create_project_prevents_overwrite_by_default(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that create_project prevents overwriting existing directory."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Existing",
-            agent_seed_phrase="seed123456789",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name="Existing")
 
         # Create existing directory
-        existing_path = context.project_path
+        existing_path = tmp_path / "existing"
         existing_path.mkdir()
 
         with pytest.raises(ScaffoldError) as exc_info:
-            scaffolder.create_project(context, overwrite=False)
+            scaffolder.create_project(context, overwrite=False, base_path=tmp_path)
 
         assert "already exists" in str(exc_info.value)
         assert "--overwrite" in str(exc_info.value)
 
     def test_create_project_allows_overwrite_when_flag_set(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that create_project allows overwriting when flag is set."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Overwrite",
-            agent_seed_phrase="seed456789012",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name="Overwrite")
 
         # Create existing directory with stale content
-        project_path = context.project_path
+        project_path = tmp_path / "overwrite"
         project_path.mkdir()
         stale_file = project_path / "README.md"
         stale_file.write_text("old content")
 
-        result_path = scaffolder.create_project(context, overwrite=True)
+        result_path = scaffolder.create_project(
+            context, overwrite=True, base_path=tmp_path
+        )
 
         assert result_path == project_path
         assert stale_file.read_text() == "rendered template.README.md.j2"
 
     def test_create_project_passes_context_to_renderer(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        renderer: DummyRenderer,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that create_project passes context dict to renderer."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
+        context = make_config(agent_name="Context Test")
 
-        context = AgentContext(
-            agent_name="Context Test",
-            agent_seed_phrase="ctxseed123456",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
-
-        scaffolder.create_project(context)
+        scaffolder.create_project(context, base_path=tmp_path)
 
         # Check that renderer received context data
         assert len(renderer.render_calls) > 0
@@ -196,88 +176,69 @@ class TestScaffolder:
             assert "agent_port" in ctx_dict
             assert "safe_name" in ctx_dict
 
+    @pytest.mark.parametrize(
+        ("agent_name", "dir_name"),
+        [
+            ("My Special Agent 123", "my-special-agent-123"),
+            ("Agent With Spaces", "agent-with-spaces"),
+        ],
+    )
     def test_create_project_uses_safe_name_for_directory(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
+        agent_name: str,
+        dir_name: str,
     ) -> None:
-        """Test that create_project uses safe_name for directory name."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="My Special Agent 123",
-            agent_seed_phrase="safeseed12345",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        """Test that create_project slugifies agent_name for the directory."""
+        context = make_config(agent_name=agent_name)
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
-        assert project_path.name == "my-special-agent-123"
+        assert project_path.exists()
+        assert project_path.name == dir_name
 
     def test_create_project_with_default_agent_name(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test create_project when agent_name is None (using default)."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_seed_phrase="defaultseed12",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name=None)
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         # Should use display_name which is "Agent " + first 8 chars of seed
         assert project_path.exists()
         assert "agent-" in project_path.name.lower()
 
     def test_create_project_creates_nested_directory(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that create_project can create in nested non-existent path."""
         nested_path = tmp_path / "deep" / "nested" / "path"
         nested_path.mkdir(parents=True)
-        monkeypatch.chdir(nested_path)
 
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Nested Agent",
-            agent_seed_phrase="nestedseed123",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name="Nested Agent")
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=nested_path)
 
         assert project_path.exists()
         assert project_path == nested_path / "nested-agent"
 
     def test_create_project_handles_empty_template_list(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self, make_config: Callable[..., AgentContext], tmp_path: Path
     ) -> None:
         """Test create_project with no templates."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer(templates=[])
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Empty Templates",
-            agent_seed_phrase="emptyseed1234",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        scaffolder = Scaffolder(DummyRenderer(templates=[]))
+        context = make_config(agent_name="Empty Templates")
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         # Directory should still be created
         assert project_path.exists()
@@ -286,28 +247,21 @@ class TestScaffolder:
         assert len(files) == 0
 
     def test_create_project_preserves_existing_files_in_overwrite_mode(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that files not in template list are preserved during overwrite."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Preserve",
-            agent_seed_phrase="preserveseed1",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name="Preserve")
 
         # Create existing directory with extra file
-        project_path = context.project_path
+        project_path = tmp_path / "preserve"
         project_path.mkdir()
         extra_file = project_path / "custom.txt"
         extra_file.write_text("custom content")
 
-        scaffolder.create_project(context, overwrite=True)
+        scaffolder.create_project(context, overwrite=True, base_path=tmp_path)
 
         # Custom file should still exist
         assert extra_file.exists()
@@ -337,104 +291,62 @@ class TestScaffolderLogging:
 
     def test_logs_project_creation(
         self,
-        monkeypatch: pytest.MonkeyPatch,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
         tmp_path: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Test that project creation is logged."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
+        context = make_config(agent_name="Log Test")
 
-        context = AgentContext(
-            agent_name="Log Test",
-            agent_seed_phrase="logseed123456",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
-
-        with caplog.at_level(logging.DEBUG):
-            scaffolder.create_project(context)
+        # INFO is the level the messages are emitted at; capturing DEBUG
+        # would also force the per-template debug path in create_project
+        with caplog.at_level(logging.INFO, logger="create_agentverse_agent.scaffold"):
+            scaffolder.create_project(context, base_path=tmp_path)
 
-        # Should have logged something
-        assert len(caplog.records) >= 0  # At minimum, no errors
+        assert any("Creating project" in record.message for record in caplog.records)
 
     def test_logs_on_overwrite(
         self,
-        monkeypatch: pytest.MonkeyPatch,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
         tmp_path: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Test that overwriting logs some information."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Warn Test",
-            agent_seed_phrase="warnseed12345",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name="Warn Test")
 
         # Create existing directory
-        context.project_path.mkdir()
+        (tmp_path / "warn-test").mkdir()
 
-        with caplog.at_level(logging.DEBUG):
-            scaffolder.create_project(context, overwrite=True)
+        with caplog.at_level(
+            logging.WARNING, logger="create_agentverse_agent.scaffold"
+        ):
+            scaffolder.create_project(context, overwrite=True, base_path=tmp_path)
 
-        # Just verify the project was created successfully
-        assert context.project_path.exists()
+        assert any(
+            "Overwriting existing directory" in record.message
+            for record in caplog.records
+        )
+        assert (tmp_path / "warn-test").exists()
 
 
 class TestScaffolderEdgeCases:
     """Test edge cases for scaffolder."""
 
-    def test_create_project_with_special_characters_in_name(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-    ) -> None:
-        """Test project creation with name containing spaces."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Agent With Spaces",
-            agent_seed_phrase="spaceseed1234",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
-
-        project_path = scaffolder.create_project(context)
-
-        assert project_path.exists()
-        assert " " not in project_path.name  # safe_name should have dashes
-
     def test_create_project_renders_all_templates(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self, make_config: Callable[..., AgentContext], tmp_path: Path
     ) -> None:
         """Test that all templates are rendered."""
-        monkeypatch.chdir(tmp_path)
         templates = [
             "template.file1.txt.j2",
             "template.file2.py.j2",
             "template.nested.config.yaml.j2",
         ]
-        renderer = DummyRenderer(templates=templates)
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Multi Template",
-            agent_seed_phrase="multiseed1234",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        scaffolder = Scaffolder(DummyRenderer(templates=templates))
+        context = make_config(agent_name="Multi Template")
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         # Check all files were created
         assert (project_path / "file1.txt").exists()
@@ -442,22 +354,13 @@ class TestScaffolderEdgeCases:
         assert (project_path / "nested.config.yaml").exists()
 
     def test_create_project_strips_template_prefix_and_suffix(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self, make_config: Callable[..., AgentContext], tmp_path: Path
     ) -> None:
         """Test that template. prefix and .j2 suffix are stripped."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer(templates=["template.myfile.txt.j2"])
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Strip Test",
-            agent_seed_phrase="stripseed1234",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        scaffolder = Scaffolder(DummyRenderer(templates=["template.myfile.txt.j2"]))
+        context = make_config(agent_name="Strip Test")
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         # File should be named without prefix/suffix
         assert (project_path / "myfile.txt").exists()
@@ -465,44 +368,27 @@ class TestScaffolderEdgeCases:
         assert not (project_path / "template.myfile.txt").exists()
 
     def test_create_project_handles_dotfiles(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self, make_config: Callable[..., AgentContext], tmp_path: Path
     ) -> None:
         """Test that dotfiles (like .env) are created correctly."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer(templates=["template..env.j2"])
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Dotfile Test",
-            agent_seed_phrase="dotseed123456",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        scaffolder = Scaffolder(DummyRenderer(templates=["template..env.j2"]))
+        context = make_config(agent_name="Dotfile Test")
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         # .env file should exist
         assert (project_path / ".env").exists()
 
     def test_create_project_counts_rendered_files(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self, make_config: Callable[..., AgentContext], tmp_path: Path
     ) -> None:
         """Test that scaffolder tracks number of rendered files."""
-        monkeypatch.chdir(tmp_path)
         templates = ["template.a.j2", "template.b.j2", "template.c.j2"]
         renderer = DummyRenderer(templates=templates)
         scaffolder = Scaffolder(renderer)
+        context = make_config(agent_name="Count Test")
 
-        context = AgentContext(
-            agent_name="Count Test",
-            agent_seed_phrase="countseed1234",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
-
-        scaffolder.create_project(context)
+        scaffolder.create_project(context, base_path=tmp_path)
 
         # All templates should have been rendered
         assert len(renderer.render_calls) == 3
@@ -512,10 +398,9 @@ class TestScaffolderIntegration:
     """Integration tests for scaffolder with real-like scenarios."""
 
     def test_full_project_creation_flow(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self, make_config: Callable[..., AgentContext], tmp_path: Path
     ) -> None:
         """Test complete project creation flow."""
-        monkeypatch.chdir(tmp_path)
 
         # Simulate real template names
         templates = [
@@ -529,20 +414,16 @@ class TestScaffolderIntegration:
             "template.README.md.j2",
             "template.requirements.txt.j2",
         ]
-        renderer = DummyRenderer(templates=templates)
-        scaffolder = Scaffolder(renderer)
+        scaffolder = Scaffolder(DummyRenderer(templates=templates))
 
-        context = AgentContext(
+        context = make_config(
             agent_name="Production Agent",
-            agent_seed_phrase="prodseed12345",
-            agent_port=8000,
             agent_description="A production-ready agent",
             hosting_address="production.example.com",
-            hosting_port=8080,
             env="production",
         )
 
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
 
         # Verify all expected files
         assert (project_path / ".env").exists()
@@ -556,23 +437,16 @@ class TestScaffolderIntegration:
         assert (project_path / "requirements.txt").exists()
 
     def test_recreate_project_after_deletion(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self,
+        scaffolder: Scaffolder,
+        make_config: Callable[..., AgentContext],
+        tmp_path: Path,
     ) -> None:
         """Test that project can be recreated after deletion."""
-        monkeypatch.chdir(tmp_path)
-        renderer = DummyRenderer()
-        scaffolder = Scaffolder(renderer)
-
-        context = AgentContext(
-            agent_name="Recreate Test",
-            agent_seed_phrase="recreateseed1",
-            agent_port=9000,
-            hosting_address="localhost",
-            hosting_port=9080,
-        )
+        context = make_config(agent_name="Recreate Test")
 
         # Create first time
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
         assert project_path.exists()
 
         # Delete
@@ -582,5 +456,5 @@ class TestScaffolderIntegration:
         assert not project_path.exists()
 
         # Recreate
-        project_path = scaffolder.create_project(context)
+        project_path = scaffolder.create_project(context, base_path=tmp_path)
         assert project_path.exists()